@@ -3,6 +3,9 @@ from panda3d.core import Vec3
 # -------- Per-track defaults (spawn & scale) ----------------------------------
 # Tweak from HUD, then bake your final values here.
 # Spielberg is kept exactly as your working MVP.
+# Optional "surfaces": {name: {"grip": .., "drag": ..}} overrides SURFACE_DEFAULTS per track.
+# Optional "surface_materials": {material or node name: surface} for tracks whose names
+# don't hit SURFACE_KEYWORDS (exact match, checked first).
 TRACK_DEFAULTS = {
     "usa_spielberg": {
         "scale": 20.0,
@@ -24,6 +27,11 @@ TRACK_DEFAULTS = {
         "scale": 25.41,
         "spawn_pos": Vec3(20786.24, -27910.24, 23.58),
         "spawn_yaw": 360.22,
+        # green-textured meshes of endurance_run.glb (material names are opaque "C20-*")
+        "surface_materials": {
+            "C20-14": "grass", "C20-19": "grass", "C20-28": "grass",
+            "C20-57": "grass", "C20-58": "grass", "C20-71": "grass",
+        },
     },
 
 }
@@ -49,6 +57,24 @@ TURN_RATE = 90.0
 TURN_MIN  = 25.0
 SPEED_MULT = 100.0
 
+# -------- Surfaces (per-triangle lookup) ------------------------------------
+# Surface ID = index in SURFACE_TYPES; 0 is the fallback for unmatched triangles.
+SURFACE_TYPES = ("asphalt", "kerb", "grass", "gravel")
+# Matched as whole words against glb material, texture and node names
+# (split on case, digits, _ - . and spaces: "GrassVerge_01" hits grass, "sandstone" doesn't).
+SURFACE_KEYWORDS = {
+    "kerb":   ("kerb", "curb", "rumble"),
+    "grass":  ("grass", "lawn", "turf", "meadow"),
+    "gravel": ("gravel", "sand", "dirt", "soil", "mud"),
+}
+# grip scales accel + steering; drag is speed bleed per second (top speed = ACCEL*grip/drag)
+SURFACE_DEFAULTS = {
+    "asphalt": {"grip": 1.00, "drag": 0.00},
+    "kerb":    {"grip": 0.90, "drag": 0.02},
+    "grass":   {"grip": 0.60, "drag": 0.40},
+    "gravel":  {"grip": 0.45, "drag": 0.80},
+}
+
 # -------- Ground fit / banking (unchanged from your last good state) --------
 GROUND_Z_MIN         = 0.25
 GROUND_MAX_DEG_STEP  = 30.0
@@ -63,6 +89,13 @@ MAX_SLOPE_DEG        = 55.0
 DELTA_DEG_TRIGGER    = 10.0
 ACCEPT_FRAMES        = 5
 
+# -------- Track load-time optimization --------------------------------------
+# Static geometry is merged per grid cell. Repeated props are only batched by cell
+# (no instancing shader under setShaderAuto); the report counts them as duplicate groups.
+TRACK_OPTIMIZE         = True
+TRACK_BATCH_CELL       = 50.0   # batching grid cell, track model units (before scale)
+TRACK_OPT_BENCH_FRAMES = 60     # offscreen frames timed before/after from the chase view (0 = skip)
+
 # -------- DEV helpers ---------------------------------------------------------
 DEV_FLY_SPEED = 12.0        # meters/sec for Q/A vertical nudging
 SCALE_STEP    = 0.5         # amount added/subtracted to the track scale per second while holding P/M
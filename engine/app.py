@@ -8,7 +8,8 @@ from panda3d.bullet import BulletWorld
 from engine.inputmap import InputMap
 from engine.camera import ChaseCamera
 from engine.assets import TRACKS, p3
-from constants import TRACK_DEFAULTS
+from engine.utils.track_opt import optimize_track
+from constants import TRACK_DEFAULTS, TRACK_OPTIMIZE
 from game.player import Player
 
 
@@ -105,6 +106,10 @@ class App(ShowBase):
         # Camera
         self.camera_sys = ChaseCamera(self, self.player.car)
 
+        # Track batching, timed from the chase view (collider already built by Player)
+        if TRACK_OPTIMIZE:
+            optimize_track(self.player.track, self)
+
         # main loop hook
         if not hasattr(self, "_task_added"):
             self.taskMgr.add(self._update, "engine_update")
@@ -1,7 +1,12 @@
 # engine/utils/__init__.py
 from .ground import GroundSolver, build_tilted_chassis
+from .track_opt import optimize_track
+from .surfaces import SurfaceTable, build_track_collider
 
 __all__ = [
     "GroundSolver",
     "build_tilted_chassis",
+    "optimize_track",
+    "SurfaceTable",
+    "build_track_collider",
 ]
@@ -18,17 +18,21 @@ class GroundSolver:
       - plane fit if 3 points; else average valid normals
       - upward enforcement; gentle pull toward WORLD_UP on steep slopes
       - small temporal smoothing; small per-frame step clamp
+      - surface ID under the car (majority of valid hits) via SurfaceTable
     """
-    def __init__(self, base):
+    def __init__(self, base, surfaces=None):
         self.base = base
+        self.surfaces = surfaces
         self.last_up = Vec3(0, 0, 1)
+        self.surface = 0
 
     def _ray_down(self, origin_world: Vec3, length: float):
         to = origin_world - Vec3(0, 0, length)
         res = self.base.bworld.rayTestClosest(origin_world, to)
         if res.hasHit():
-            return res.getHitPos(), res.getHitNormal()
-        return None, None
+            sid = self.surfaces.lookup(res.getTriangleIndex()) if self.surfaces else 0
+            return res.getHitPos(), res.getHitNormal(), sid
+        return None, None, 0
 
     def estimate(self, car_np, half_w: float, half_l: float):
         r = self.base.render
@@ -40,10 +44,10 @@ class GroundSolver:
         off_fr = Vec3( -half_w * SAMPLE_W_FRAC,  half_l * SAMPLE_FWD_FRACTION, 0)
         off_rc = Vec3(  0.0,                    -half_l * SAMPLE_REAR_FRACTION, 0)
 
-        points, normals, zs = [], [], []
+        points, normals, zs, sids = [], [], [], []
         for off in (off_fl, off_fr, off_rc):
             origin = pos + q.xform(off) + Vec3(0, 0, GROUND_RAY_HEIGHT)
-            hp, n = self._ray_down(origin, GROUND_RAY_LENGTH)
+            hp, n, sid = self._ray_down(origin, GROUND_RAY_LENGTH)
             if hp is None:
                 continue
             if n.z < 0: n = -n
@@ -51,10 +55,14 @@ class GroundSolver:
                 points.append(hp)
                 normals.append(n)
                 zs.append(hp.z)
+                sids.append(sid)
 
         if not points and not normals:
             return self.last_up, None
 
+        # surface: majority of valid hits (ties -> front-left first)
+        self.surface = max(sids, key=sids.count)
+
         # raw normal
         if len(points) >= 3:
             v1 = points[0] - points[2]
@@ -0,0 +1,112 @@
+# engine/utils/surfaces.py
+import re
+from array import array
+from panda3d.core import TransformState, MaterialAttrib, TextureAttrib
+from panda3d.bullet import BulletTriangleMesh
+
+from constants import SURFACE_TYPES, SURFACE_KEYWORDS, SURFACE_DEFAULTS
+
+
+class SurfaceTable:
+    """
+    Compact per-triangle surface map for the track collider:
+      - ids[tri] = surface ID (index into SURFACE_TYPES), one byte per triangle
+      - grip[id] / drag[id] = per-track tuning, resolved once at load
+    Triangle order matches the BulletTriangleMesh, so a ray hit's
+    triangle index is a direct O(1) lookup.
+    """
+    def __init__(self, overrides=None):
+        self.ids = array('B')
+        self.names = SURFACE_TYPES
+        self.configure(overrides)
+
+    def configure(self, overrides=None):
+        overrides = overrides or {}
+        for name, params in overrides.items():
+            if name not in self.names:
+                raise ValueError(f"unknown surface {name!r} (expected one of {self.names})")
+            bad = set(params) - {"grip", "drag"}
+            if bad:
+                raise ValueError(f"unknown {name!r} surface params {sorted(bad)} (expected grip/drag)")
+        params = [{**SURFACE_DEFAULTS[n], **overrides.get(n, {})} for n in self.names]
+        self.grip = array('f', (p["grip"] for p in params))
+        self.drag = array('f', (p["drag"] for p in params))
+
+    def extend(self, surface_id: int, count: int):
+        self.ids.extend(array('B', (surface_id,)) * count)
+
+    def lookup(self, tri_index: int) -> int:
+        if 0 <= tri_index < len(self.ids):
+            return self.ids[tri_index]
+        return 0
+
+
+def _surface_id(name: str) -> int:
+    if name not in SURFACE_TYPES:
+        raise ValueError(f"unknown surface {name!r} (expected one of {SURFACE_TYPES})")
+    return SURFACE_TYPES.index(name)
+
+
+def _tokens(name: str) -> set:
+    """'GrassVerge_01.png' -> {'grass', 'verge', 'png'}: split on case, digits, _ - . and spaces."""
+    return {t.lower() for t in re.findall(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])", name)}
+
+
+def classify_state(state, node_names=(), materials=None) -> int:
+    """
+    Surface ID for a geom:
+      1) exact material / node name in the track's "surface_materials" map
+      2) first SURFACE_KEYWORDS token match on material / texture / node names
+    """
+    names = list(node_names)
+    mat = state.get_attrib(MaterialAttrib)
+    if mat and mat.get_material():
+        names.append(mat.get_material().get_name())
+    if materials:
+        for n in names:
+            if n in materials:
+                return _surface_id(materials[n])
+
+    tex = state.get_attrib(TextureAttrib)
+    if tex:
+        for i in range(tex.get_num_on_stages()):
+            t = tex.get_on_texture(tex.get_on_stage(i))
+            names.append(t.get_name())
+            names.append(t.get_filename().get_basename())
+    tokens = set().union(*map(_tokens, names))
+
+    for name, keys in SURFACE_KEYWORDS.items():
+        if tokens.intersection(keys):
+            return SURFACE_TYPES.index(name)
+    return 0
+
+
+def build_track_collider(track_np, overrides=None, materials=None):
+    """
+    Triangle mesh for the static track + matching SurfaceTable.
+    Each geom's surface ID is written once per triangle it contributed.
+    Run on the loaded hierarchy, before optimize_track() merges nodes away.
+    """
+    for name in (materials or {}).values():
+        _surface_id(name)  # fail fast on typos, even for names that never match
+
+    mesh = BulletTriangleMesh()
+    table = SurfaceTable(overrides)
+    for np in track_np.find_all_matches('**/+GeomNode'):
+        gnode = np.node()
+        net = np.getNetTransform()
+        net_state = np.getNetState()
+        # GeomNode + its ancestors up to the track root (p3assimp keeps object names here)
+        node_names = []
+        for a in np.get_ancestors():
+            if a == track_np:
+                break
+            node_names.append(a.getName())
+        for i in range(gnode.get_num_geoms()):
+            geom = gnode.get_geom(i)
+            before = mesh.get_num_triangles()
+            mesh.addGeom(geom, True, TransformState.makeMat(net.getMat()))
+            sid = classify_state(net_state.compose(gnode.get_geom_state(i)), node_names, materials)
+            table.extend(sid, mesh.get_num_triangles() - before)
+    return mesh, table
+
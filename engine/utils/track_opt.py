@@ -0,0 +1,177 @@
+# engine/utils/track_opt.py
+import hashlib
+import time
+from panda3d.core import (
+    Camera, Character, ClockObject, LODNode, SelectiveChildNode, BitMask32,
+)
+
+from constants import TRACK_BATCH_CELL, TRACK_OPT_BENCH_FRAMES
+
+# Nodes whose children are drawn selectively: merging them would draw every child.
+_SELECTIVE_TYPES = (
+    Character.get_class_type(),
+    LODNode.get_class_type(),
+    SelectiveChildNode.get_class_type(),  # SwitchNode, SequenceNode
+)
+
+
+def count_draw_calls(np) -> int:
+    """One Geom under a GeomNode = one draw call (per instance path)."""
+    return sum(p.node().get_num_geoms() for p in np.find_all_matches('**/+GeomNode'))
+
+
+def measure_frame_ms(base, frames: int) -> float:
+    """
+    Average frame time (cull + draw, GPU included) of the current camera view.
+    Drawn into an offscreen buffer with the main window paused and the clock
+    limit lifted, so neither vsync nor clock-frame-rate pins it at ~16.7 ms.
+    """
+    if frames <= 0 or base.win is None:
+        return 0.0
+    buf = base.win.make_texture_buffer(
+        'track_opt_bench', base.win.get_x_size(), base.win.get_y_size())
+    if buf is None:
+        return 0.0
+    cam = base.camera.attach_new_node(Camera('track_opt_bench', base.camLens))
+    buf.make_display_region().set_camera(cam)
+
+    engine = base.graphicsEngine
+    clock = ClockObject.get_global_clock()
+    mode = clock.get_mode()
+    clock.set_mode(ClockObject.M_normal)
+    base.win.set_active(False)  # no flip -> no vsync wait; the buffer still draws on its GSG
+    try:
+        engine.render_frame()  # warm-up: texture/buffer uploads + shader generation
+        engine.extract_texture_data(buf.get_texture(), buf.get_gsg())
+        t0 = time.perf_counter()
+        for _ in range(frames):
+            engine.render_frame()
+        # GL queues work: read the target back so the GPU has finished every frame
+        engine.extract_texture_data(buf.get_texture(), buf.get_gsg())
+        return (time.perf_counter() - t0) * 1000.0 / frames
+    finally:
+        base.win.set_active(True)
+        clock.set_mode(mode)
+        engine.remove_window(buf)
+        cam.remove_node()
+
+
+def _geom_digest(geom) -> bytes:
+    """Hash of vertex format, vertex arrays and index data. Equal digest -> same mesh."""
+    h = hashlib.blake2b(digest_size=16)
+    vdata = geom.get_vertex_data()
+    h.update(str(vdata.get_format()).encode())
+    for i in range(vdata.get_num_arrays()):
+        h.update(bytes(vdata.get_array(i).get_handle().get_data()))
+    for i in range(geom.get_num_primitives()):
+        prim = geom.get_primitive(i)
+        h.update(prim.get_type().get_name().encode())
+        if prim.is_indexed():
+            h.update(bytes(prim.get_vertices().get_handle().get_data()))
+        else:
+            h.update(b"%d:%d" % (prim.get_first_vertex(), prim.get_num_vertices()))
+    return h.digest()
+
+
+def find_duplicate_geoms(track_np):
+    """
+    Group identical meshes by vertex/index data hash. Returns (groups, copies):
+    mesh digests used more than once, and the total Geoms in those groups.
+    Reported only: flattenStrong bakes each copy into its cell anyway, so
+    these are the props an instancing shader would gain on.
+    """
+    counts = {}
+    for np in track_np.find_all_matches('**/+GeomNode'):
+        gnode = np.node()
+        for i in range(gnode.get_num_geoms()):
+            key = _geom_digest(gnode.get_geom(i))
+            counts[key] = counts.get(key, 0) + 1
+    dup = [n for n in counts.values() if n > 1]
+    return len(dup), sum(dup)
+
+
+def _can_batch(np, track_np) -> bool:
+    """
+    False if anything between np and track_np (np included) would change
+    meaning once the node is moved and flattened: selective parents
+    (LOD/Switch/Sequence/Character), custom draw masks (hide()), or render
+    effects (billboard, compass, decal, ...).
+    """
+    for a in np.get_ancestors():
+        if a == track_np:
+            return True
+        node = a.node()
+        if any(node.is_of_type(t) for t in _SELECTIVE_TYPES):
+            return False
+        if node.get_draw_control_mask() != BitMask32.all_off():
+            return False
+        if not node.get_effects().is_empty():
+            return False
+    return True
+
+
+def batch_static_geoms(track_np, cell: float) -> int:
+    """
+    Bucket static GeomNodes into an XY grid (track space), then flattenStrong
+    each bucket so same-state geometry (repeated props included) collapses
+    into a few large Geoms. The grid keeps batches small enough for frustum
+    culling to still help. Returns the number of cells.
+    """
+    track_np.clear_model_nodes()
+    root = track_np.attach_new_node('batched')
+    cells = {}
+    for np in track_np.find_all_matches('**/+GeomNode'):
+        if not _can_batch(np, track_np):
+            continue
+        b = np.get_tight_bounds(track_np)
+        c = (b[0] + b[1]) * 0.5 if b else np.get_pos(track_np)
+        key = (int(c.x // cell), int(c.y // cell))
+        if key not in cells:
+            cells[key] = root.attach_new_node(f'cell_{key[0]}_{key[1]}')
+        # keep the state inherited from the glTF ancestors we're about to drop
+        np.set_state(np.get_state(track_np))
+        np.wrt_reparent_to(cells[key])
+
+    for cell_np in cells.values():
+        cell_np.flatten_strong()
+
+    # drop the now-empty glTF hierarchy left behind
+    for child in track_np.get_children():
+        if child != root and child.find('**/+GeomNode').is_empty():
+            child.remove_node()
+    return len(cells)
+
+
+def optimize_track(track_np, base=None, cell: float = TRACK_BATCH_CELL,
+                   bench_frames: int = TRACK_OPT_BENCH_FRAMES):
+    """
+    Load-time pass over the track: merge static same-state geometry per grid
+    cell via flattenStrong. Prints draw calls, duplicate meshes and (given
+    `base` with a placed camera) frame time before/after; returns them as a dict.
+
+    Only the track's children are flattened, so the root keeps its own
+    transform (live P/M scale still works). Build the collider first:
+    merging loses the per-node names used for surface classification.
+
+    Note: true hardware instancing needs a custom instancing shader, which
+    setShaderAuto() does not generate, so repeated props are only batched
+    by cell; `dup_groups` shows the tracks that would gain from one.
+    """
+    bench = base is not None and bench_frames > 0
+    stats = {"draw_calls_before": count_draw_calls(track_np)}
+    stats["dup_groups"], stats["dup_geoms"] = find_duplicate_geoms(track_np)
+    if bench:
+        stats["frame_ms_before"] = measure_frame_ms(base, bench_frames)
+    stats["cells"] = batch_static_geoms(track_np, cell)
+    stats["draw_calls_after"] = count_draw_calls(track_np)
+    if bench:
+        stats["frame_ms_after"] = measure_frame_ms(base, bench_frames)
+
+    line = (
+        f"[track_opt] draw calls {stats['draw_calls_before']} -> {stats['draw_calls_after']}  "
+        f"({stats['cells']} cells, {stats['dup_geoms']} geoms in {stats['dup_groups']} duplicate groups)"
+    )
+    if bench:
+        line += f"  frame {stats['frame_ms_before']:.2f} ms -> {stats['frame_ms_after']:.2f} ms"
+    print(line)
+    return stats
@@ -1,8 +1,8 @@
 import math
 from direct.gui.OnscreenText import OnscreenText
-from panda3d.core import Vec3, TransformState, BitMask32
+from panda3d.core import Vec3, BitMask32
 from direct.task import Task
-from panda3d.bullet import BulletTriangleMesh, BulletTriangleMeshShape, BulletRigidBodyNode
+from panda3d.bullet import BulletTriangleMeshShape, BulletRigidBodyNode
 
 from constants import (
     MAX_SPEED, ACCEL, BRAKE, FRICTION, TURN_RATE, TURN_MIN,
@@ -10,13 +10,14 @@ from constants import (
 )
 from engine.assets import p3, TESLA
 from engine.utils.ground import GroundSolver, build_tilted_chassis
+from engine.utils.surfaces import build_track_collider
 
 
 class Player:
     """
     One race scene:
       - loads the chosen track model and Tesla
-      - arcade drive + ground follow
+      - arcade drive + ground follow (per-surface grip/drag)
       - DEV controls: Q/A fly, P/M live scale
       - HUD shows pos/orientation + track name & scale
     """
@@ -32,14 +33,10 @@ class Player:
         self.scale = float(defaults["scale"])
         self.track.setScale(self.scale)
 
-        # --- Static collider from visual track ---
-        mesh = BulletTriangleMesh()
-        for np in self.track.find_all_matches('**/+GeomNode'):
-            gnode = np.node()
-            net = np.getNetTransform()
-            for i in range(gnode.get_num_geoms()):
-                geom = gnode.get_geom(i)
-                mesh.addGeom(geom, True, TransformState.makeMat(net.getMat()))
+        # --- Static collider from visual track (+ per-triangle surface IDs) ---
+        # built before App runs optimize_track: batching merges away the names surfaces are classified by
+        mesh, self.surfaces = build_track_collider(
+            self.track, defaults.get("surfaces"), defaults.get("surface_materials"))
         shape = BulletTriangleMeshShape(mesh, dynamic=False)
         rb = BulletRigidBodyNode('track_static')
         rb.addShape(shape)
@@ -68,7 +65,7 @@ class Player:
         self.speed = 0.0
 
         # Ground solver
-        self.ground = GroundSolver(base)
+        self.ground = GroundSolver(base, self.surfaces)
 
         # DEV HUD
         self.hud = OnscreenText(
@@ -81,17 +78,25 @@ class Player:
 
     # ---------- Driving (arcade) ----------
     def _apply_drive(self, dt: float):
-        if self.inp.held.get("up"):    self.speed += ACCEL * dt
+        sid = self.ground.surface
+        grip = self.surfaces.grip[sid]
+        drag = self.surfaces.drag[sid]
+
+        if self.inp.held.get("up"):    self.speed += ACCEL * grip * dt
         if self.inp.held.get("down"):  self.speed -= BRAKE * dt
 
         if not self.inp.held.get("up") and not self.inp.held.get("down"):
             if self.speed > 0:  self.speed = max(0.0, self.speed - FRICTION * dt)
             if self.speed < 0:  self.speed = min(0.0, self.speed + FRICTION * dt)
 
+        # surface drag: bleeds speed proportionally (grass/gravel slow you down)
+        self.speed -= self.speed * min(1.0, drag * dt)
+
         self.speed = max(-10.0, min(MAX_SPEED, self.speed))
 
         steer = (1.0 if self.inp.held.get("left") else 0.0) + (-1.0 if self.inp.held.get("right") else 0.0)
         steer_scale = TURN_MIN + (TURN_RATE - TURN_MIN) * min(1.0, abs(self.speed) / (0.6 * MAX_SPEED))
+        steer_scale *= grip
         self.car.setH(self.car.getH() + steer * steer_scale * dt * (1 if self.speed >= 0 else -1))
 
         # Forward movement along car's local +Y
@@ -134,6 +139,7 @@ class Player:
             f"[{self.track_def['name']}] scale:{self.scale:.2f}  "
             f"X:{pos.x:7.2f}  Y:{pos.y:7.2f}  Z:{pos.z:6.2f}  "
             f"H:{h:6.2f}  P:{p:5.2f}  R:{r:5.2f}  "
+            f"surface:{self.surfaces.names[self.ground.surface]}  "
             f"  (Q/A fly  P/M scale)"
         )
         if force or txt != getattr(self, "_last_txt", None):
@@ -0,0 +1,67 @@
+"""
+Surface lookup overhead per ground ray: python tests/bench_surfaces.py
+
+Times GroundSolver._ray_down (rayTestClosest + hit accessors) with and
+without a SurfaceTable, so the difference is getTriangleIndex() + lookup.
+"""
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from panda3d.core import NodePath, Vec3, BitMask32  # noqa: E402
+from panda3d.bullet import BulletWorld, BulletTriangleMeshShape, BulletRigidBodyNode  # noqa: E402
+
+from conftest import _quad  # noqa: E402
+from engine.utils.ground import GroundSolver  # noqa: E402
+from engine.utils.surfaces import build_track_collider  # noqa: E402
+
+GRID = 40       # GRID x GRID quads, alternating road/grass
+RAYS = 20_000
+
+
+def _world():
+    track = NodePath('track')
+    for i in range(GRID * GRID):
+        name = "road_asphalt" if i % 2 else "grass_verge"
+        track.attach_new_node(name).attach_new_node(_quad(name, i % GRID)).set_y(i // GRID)
+    mesh, table = build_track_collider(track)
+
+    world = BulletWorld()
+    rb = BulletRigidBodyNode('track_static')
+    rb.addShape(BulletTriangleMeshShape(mesh, dynamic=False))
+    NodePath(rb).setCollideMask(BitMask32.allOn())
+    world.attach(rb)
+    return world, table
+
+
+def _time_rays(solver, origins):
+    t0 = time.perf_counter()
+    for o in origins:
+        solver._ray_down(o, 10.0)
+    return (time.perf_counter() - t0) / len(origins) * 1e9
+
+
+def main():
+    world, table = _world()
+    base = SimpleNamespace(bworld=world)
+    rng = random.Random(0)
+    origins = [Vec3(rng.uniform(0, GRID), rng.uniform(0, GRID), 5.0) for _ in range(RAYS)]
+
+    plain = GroundSolver(base)
+    surf = GroundSolver(base, table)
+    _time_rays(plain, origins[:1000]); _time_rays(surf, origins[:1000])  # warm-up
+    t_plain = min(_time_rays(plain, origins) for _ in range(3))
+    t_surf = min(_time_rays(surf, origins) for _ in range(3))
+
+    print(f"triangles: {len(table.ids)}  table: {len(table.ids)} bytes")
+    print(f"ray (pos+normal):            {t_plain:8.0f} ns")
+    print(f"ray (+ triangle index, ID):  {t_surf:8.0f} ns")
+    print(f"overhead: {t_surf - t_plain:.0f} ns/ray, {3 * (t_surf - t_plain) / 1e3:.2f} us/frame (3 rays)")
+
+
+if __name__ == "__main__":
+    main()
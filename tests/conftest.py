@@ -0,0 +1,32 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# tests import project modules (constants, engine.*) from the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from panda3d.core import (  # noqa: E402
+    GeomNode, Geom, GeomTriangles, GeomVertexData, GeomVertexFormat, GeomVertexWriter,
+)
+
+
+def _quad(name="quad", x0=0.0):
+    """GeomNode '<name>_mesh' holding a 1x1 quad (2 triangles) at x0..x0+1, z=0."""
+    vdata = GeomVertexData(name, GeomVertexFormat.get_v3(), Geom.UH_static)
+    w = GeomVertexWriter(vdata, 'vertex')
+    for x, y in ((x0, 0), (x0 + 1, 0), (x0 + 1, 1), (x0, 1)):
+        w.add_data3(x, y, 0)
+    tris = GeomTriangles(Geom.UH_static)
+    tris.add_vertices(0, 1, 2)
+    tris.add_vertices(0, 2, 3)
+    geom = Geom(vdata)
+    geom.add_primitive(tris)
+    gnode = GeomNode(f'{name}_mesh')
+    gnode.add_geom(geom)
+    return gnode
+
+
+@pytest.fixture
+def make_quad():
+    return _quad
@@ -0,0 +1,96 @@
+from types import SimpleNamespace
+
+import pytest
+from panda3d.core import NodePath, Vec3, BitMask32
+from panda3d.bullet import BulletWorld, BulletTriangleMeshShape, BulletRigidBodyNode
+
+from constants import SURFACE_TYPES, SURFACE_DEFAULTS
+from engine.utils.ground import GroundSolver
+from engine.utils.surfaces import SurfaceTable, build_track_collider
+from engine.utils.track_opt import optimize_track
+
+GRASS = SURFACE_TYPES.index("grass")
+GRAVEL = SURFACE_TYPES.index("gravel")
+
+
+@pytest.fixture
+def make_track(make_quad):
+    def _track(*names):
+        """glTF/assimp-like tree: root / <object name> / GeomNode, all sharing one state."""
+        root = NodePath('track')
+        for i, name in enumerate(names):
+            root.attach_new_node(name).attach_new_node(make_quad(name, i * 2.0))
+        return root
+    return _track
+
+
+def test_keyword_from_node_name(make_track):
+    _, table = build_track_collider(make_track("road_asphalt", "grass_verge"))
+    assert list(table.ids) == [0, 0, GRASS, GRASS]
+
+
+def test_classified_before_optimize_survives_batching(make_track):
+    # same state -> optimize_track merges both quads into one Geom named after the road
+    track = make_track("road_asphalt", "grass_verge")
+    _, table = build_track_collider(track)
+    optimize_track(track, cell=100.0)
+    assert track.find_all_matches('**/+GeomNode').get_num_paths() == 1
+    assert table.lookup(2) == table.lookup(3) == GRASS
+
+
+def test_track_material_map(make_track):
+    track = make_track("C20-1", "C20-14")
+    _, table = build_track_collider(track, materials={"C20-14": "grass"})
+    assert list(table.ids) == [0, 0, GRASS, GRASS]
+
+
+def test_track_material_map_unknown_surface(make_track):
+    with pytest.raises(ValueError):
+        build_track_collider(make_track("C20-1"), materials={"C20-1": "Grass"})
+
+
+def test_overrides():
+    table = SurfaceTable({"grass": {"grip": 0.3}})
+    assert table.grip[GRASS] == pytest.approx(0.3)
+    assert table.drag[GRASS] == pytest.approx(SURFACE_DEFAULTS["grass"]["drag"])
+
+
+@pytest.mark.parametrize("overrides", [
+    {"Grass": {"grip": 0.3}},
+    {"grass": {"grp": 0.3}},
+])
+def test_overrides_reject_typos(overrides):
+    with pytest.raises(ValueError):
+        SurfaceTable(overrides)
+
+
+def test_lookup_out_of_range_is_default():
+    table = SurfaceTable()
+    table.extend(GRASS, 2)
+    assert table.lookup(1) == GRASS
+    assert table.lookup(2) == table.lookup(-1) == 0
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("GrassVerge_01", GRASS),
+    ("gravel-trap", GRAVEL),
+    ("sandstone_wall", 0),
+    ("thousand_oaks", 0),
+    ("mudguard", 0),
+])
+def test_keywords_match_whole_words(make_track, name, expected):
+    _, table = build_track_collider(make_track(name))
+    assert list(table.ids) == [expected, expected]
+
+
+def test_ray_hit_returns_surface(make_track):
+    mesh, table = build_track_collider(make_track("road_asphalt", "grass_verge"))
+    world = BulletWorld()
+    rb = BulletRigidBodyNode('track_static')
+    rb.addShape(BulletTriangleMeshShape(mesh, dynamic=False))
+    NodePath(rb).setCollideMask(BitMask32.allOn())
+    world.attach(rb)
+
+    solver = GroundSolver(SimpleNamespace(bworld=world), table)
+    assert solver._ray_down(Vec3(0.5, 0.5, 5), 10)[2] == 0       # road quad at x 0..1
+    assert solver._ray_down(Vec3(2.5, 0.5, 5), 10)[2] == GRASS   # grass quad at x 2..3
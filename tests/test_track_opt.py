@@ -0,0 +1,101 @@
+import pytest
+from panda3d.core import (
+    NodePath, ColorAttrib, TransformState, LODNode, SwitchNode, SequenceNode,
+    BillboardEffect, CompassEffect,
+)
+from panda3d.bullet import BulletTriangleMesh
+
+from engine.utils.track_opt import optimize_track, count_draw_calls
+
+
+@pytest.fixture
+def track(make_quad):
+    """glTF-like tree: root / prop_i (transform + color) / GeomNode(identical quad)."""
+    root = NodePath('track')
+    for i in range(3):
+        parent = root.attach_new_node(f'prop_{i}')
+        parent.set_pos(i * 2.0, 0, 0)
+        parent.set_color(1, 0, 0, 1)
+        parent.attach_new_node(make_quad(f'prop_{i}'))
+    return root
+
+
+def _num_triangles(np):
+    mesh = BulletTriangleMesh()
+    for p in np.find_all_matches('**/+GeomNode'):
+        net = TransformState.make_mat(p.get_net_transform().get_mat())
+        for i in range(p.node().get_num_geoms()):
+            mesh.add_geom(p.node().get_geom(i), True, net)
+    return mesh.get_num_triangles()
+
+
+def test_duplicates_are_batched(track):
+    stats = optimize_track(track, cell=100.0)
+    assert stats["draw_calls_before"] == 3
+    assert stats["draw_calls_after"] == 1 == count_draw_calls(track)
+    assert (stats["dup_groups"], stats["dup_geoms"]) == (1, 3)
+
+
+def test_collider_triangles_preserved(track):
+    before = _num_triangles(track)
+    optimize_track(track, cell=100.0)
+    assert _num_triangles(track) == before == 6
+
+
+def test_inherited_state_survives(track):
+    optimize_track(track, cell=100.0)
+    for p in track.find_all_matches('**/+GeomNode'):
+        for i in range(p.node().get_num_geoms()):
+            state = p.get_net_state().compose(p.node().get_geom_state(i))
+            color = state.get_attrib(ColorAttrib)
+            assert color is not None and color.get_color() == (1, 0, 0, 1)
+
+
+def test_root_transform_untouched(track):
+    track.set_scale(20.0)
+    optimize_track(track, cell=100.0)
+    assert track.get_scale() == (20.0, 20.0, 20.0)
+
+
+def test_hidden_parent_stays_hidden(track):
+    hidden = track.find('prop_0')
+    hidden.hide()
+    optimize_track(track, cell=100.0)
+    assert hidden.get_parent() == track
+    assert hidden.find('**/+GeomNode').is_hidden()
+    assert count_draw_calls(track) == 2
+
+
+def _selective(kind):
+    if kind == "lod":
+        node = LODNode('lod')
+        for near, far in ((0, 10), (10, 100), (100, 1000)):
+            node.add_switch(far, near)
+        return node
+    if kind == "switch":
+        return SwitchNode('switch')
+    return SequenceNode('sequence')
+
+
+@pytest.mark.parametrize("kind", ["lod", "switch", "sequence"])
+def test_selective_children_not_merged(track, make_quad, kind):
+    sel = track.attach_new_node(_selective(kind))
+    for i in range(3):
+        sel.attach_new_node(make_quad(f'{kind}_{i}'))
+    optimize_track(track, cell=100.0)
+    assert sel.get_parent() == track
+    assert sel.node().get_num_children() == 3
+    assert count_draw_calls(sel) == 3
+
+
+@pytest.mark.parametrize("effect", [
+    BillboardEffect.make_point_eye(),
+    CompassEffect.make(NodePath('ref')),
+])
+def test_effect_ancestor_not_merged(track, effect):
+    prop = track.find('prop_0')
+    prop.set_effect(effect)
+    optimize_track(track, cell=100.0)
+    assert prop.get_parent() == track
+    assert prop.has_effect(type(effect).get_class_type())
+    assert count_draw_calls(prop) == 1